@@ -7,10 +7,12 @@ Enhanced version with detailed firmware update information
 from cmk.agent_based.v2 import (
     AgentSection, 
     CheckPlugin, 
+    IgnoreResultsError,
     Service, 
     Result, 
     State, 
-    Metric
+    Metric,
+    get_value_store,
 )
 from typing import Any, Dict, Optional
 import itertools
@@ -115,8 +117,74 @@ def discover_fortigate_firmware(section):
     if section:
         yield Service()
 
+# Bump whenever the firmware analysis or its stored format changes, so that
+# analyses stored by an older plugin version are not replayed.
+FIRMWARE_ANALYSIS_VERSION = 1
+
+def _serialize_firmware_results(results):
+    """Convert check results into plain data that fits into the value store
+
+    Results keep state, summary and details (notice-only results have an empty
+    summary). Metrics keep name, value, levels and boundaries.
+    """
+    serialized = []
+    for item in results:
+        if isinstance(item, Result):
+            serialized.append(["result", int(item.state), item.summary, item.details])
+        elif isinstance(item, Metric):
+            serialized.append(["metric", item.name, item.value, item.levels, item.boundaries])
+        else:
+            raise TypeError(f"Cannot store firmware check output of type {type(item).__name__}")
+    return serialized
+
+def _deserialize_firmware_results(serialized):
+    """Rebuild check results from their value store representation"""
+    for entry in serialized:
+        if entry[0] == "result":
+            _, state, summary, details = entry
+            if not summary:
+                yield Result(state=State(state), notice=details)
+            else:
+                yield Result(state=State(state), summary=summary, details=(details if details != summary else None))
+        elif entry[0] == "metric":
+            _, name, value, levels, boundaries = entry
+            yield Metric(
+                name,
+                value,
+                levels=(tuple(levels) if levels is not None else None),
+                boundaries=(tuple(boundaries) if boundaries is not None else None),
+            )
+
 def check_fortigate_firmware(section):
-    """Check function for Fortigate Firmware - Enhanced with CRITICAL logic"""
+    """Check function for Fortigate Firmware - reuses the stored analysis while the digest is unchanged"""
+    if not section or "digest" not in section:
+        yield from _analyze_fortigate_firmware(section)
+        return
+
+    value_store = get_value_store()
+    digest = str(section["digest"])
+
+    if section.get("status") == "unchanged":
+        cached = value_store.get("fortigate_firmware_analysis")
+        if (
+            isinstance(cached, dict)
+            and cached.get("version") == FIRMWARE_ANALYSIS_VERSION
+            and cached.get("digest") == digest
+        ):
+            yield from _deserialize_firmware_results(cached.get("results", []))
+            return
+        raise IgnoreResultsError("Firmware data unchanged but no stored analysis found, waiting for full payload")
+
+    results = list(_analyze_fortigate_firmware(section))
+    value_store["fortigate_firmware_analysis"] = {
+        "version": FIRMWARE_ANALYSIS_VERSION,
+        "digest": digest,
+        "results": _serialize_firmware_results(results),
+    }
+    yield from results
+
+def _analyze_fortigate_firmware(section):
+    """Analyze a full firmware payload - Enhanced with CRITICAL logic"""
     if not section:
         yield Result(state=State.UNKNOWN, summary="No firmware data received")
         return
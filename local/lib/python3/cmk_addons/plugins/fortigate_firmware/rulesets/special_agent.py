@@ -9,7 +9,10 @@ from cmk.rulesets.v1.form_specs import (
     Password,
     DefaultValue,
     BooleanChoice,
+    TimeMagnitude,
+    TimeSpan,
     migrate_to_password,
+    validators,
 )
 try:
     from cmk.rulesets.v1.form_specs import SingleChoice, SingleChoiceElement  # type: ignore
@@ -78,6 +81,30 @@ def _parameter_form():
                     prefill=DefaultValue(False),
                 ),
             ),
+            "digest_only": DictElement(
+                required=False,
+                parameter_form=BooleanChoice(
+                    title=Title("Send only a digest while firmware data is unchanged"),
+                    help_text=Help(
+                        "The special agent hashes the firmware catalog and sends only the digest when it matches "
+                        "the previous run. The check reuses its last stored analysis for a matching digest."
+                    ),
+                    prefill=DefaultValue(False),
+                ),
+            ),
+            "full_payload_interval": DictElement(
+                required=False,
+                parameter_form=TimeSpan(
+                    title=Title("Full firmware payload interval"),
+                    help_text=Help(
+                        "Only applies when \"Send only a digest while firmware data is unchanged\" is enabled. "
+                        "Force a full firmware payload after this time (default 15 minutes, 1 minute to 1 hour)."
+                    ),
+                    displayed_magnitudes=[TimeMagnitude.MINUTE, TimeMagnitude.SECOND],
+                    prefill=DefaultValue(900.0),
+                    custom_validate=(validators.NumberInRange(min_value=60, max_value=3600),),
+                ),
+            ),
             "port": DictElement(
                 required=False,
                 parameter_form=Integer(
@@ -33,6 +33,11 @@ def _agent_arguments(params, host_config):
     if ok_flag:
         args.append("--ok-if-unmatured-branch")
 
+    if params.get("digest_only", False):
+        args.extend(["--digest-only", "--state-key", host_config.name])
+        if "full_payload_interval" in params:
+            args.extend(["--full-interval", str(int(params["full_payload_interval"]))])
+
     if "port" in params:
         args.extend(["--port", str(params["port"])])
 